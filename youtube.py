@@ -11,47 +11,91 @@ import subprocess
 import shutil
 import os
 import json
+import time
+import threading
+import re
+import locale
+import atexit
+import functools
+import importlib
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import MappingProxyType
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+from typing import NamedTuple
+
+
+@functools.cache
+def _ffmpeg_path() -> str | None:
+    # PATH scan is slow on Windows; clear the cache if PATH changes
+    return shutil.which("ffmpeg")
 
 
 # -- Dependency check --
 def install_dependencies():
     if getattr(sys, "frozen", False):
         return
-    ffmpeg_in_path = shutil.which("ffmpeg") is not None
-    required = ["yt-dlp", "requests"]
+    ffmpeg_in_path = _ffmpeg_path() is not None
+    required = ["yt-dlp", "requests", "diskcache"]
     if not ffmpeg_in_path:
         required.append("static-ffmpeg")
+    modules = {
+        "yt-dlp": "yt_dlp",
+        "requests": "requests",
+        "diskcache": "diskcache",
+        "static-ffmpeg": "static_ffmpeg",
+    }
     for pkg in required:
-        try:
-            if pkg == "yt-dlp":
-                import yt_dlp
-            elif pkg == "requests":
-                import requests
-            elif pkg == "static-ffmpeg":
-                import static_ffmpeg
-        except ImportError:
+        # Only locate the module; the heavy imports happen on first use
+        if importlib.util.find_spec(modules[pkg]) is None:
             print(f"[!] {pkg} not found. Installing...")
             subprocess.check_call([sys.executable, "-m", "pip", "install", pkg])
+            importlib.invalidate_caches()
 
 
 install_dependencies()
 
-import yt_dlp
-import requests
 
-requests.packages.urllib3.disable_warnings()
+# -- Lazy Imports --
+# yt-dlp pulls in hundreds of extractor modules, so it (and requests) are only
+# imported once the user actually fetches or downloads something.
+@functools.lru_cache(maxsize=1)
+def _get_ytdlp():
+    import yt_dlp
+
+    return yt_dlp
+
+
+@functools.lru_cache(maxsize=1)
+def get_session():
+    """Shared session so proxy probes and any later HTTP calls reuse
+    kept-alive connections instead of paying a fresh TCP+TLS handshake."""
+    import requests
+
+    requests.packages.urllib3.disable_warnings()
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=4, pool_maxsize=8, max_retries=0
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 
 # -- FFmpeg Resolution --
-FFMPEG_PATH = shutil.which("ffmpeg")
-if not FFMPEG_PATH:
-    try:
-        import static_ffmpeg
+def _resolve_ffmpeg() -> str | None:
+    path = _ffmpeg_path()
+    if not path:
+        try:
+            import static_ffmpeg
+
+            static_ffmpeg.add_paths()
+            _ffmpeg_path.cache_clear()
+            path = _ffmpeg_path()
+        except:
+            pass
+    return path
 
-        static_ffmpeg.add_paths()
-        FFMPEG_PATH = shutil.which("ffmpeg")
-    except:
-        pass
 
 # -- Configuration --
 CONFIG_FILE = "config.json"
@@ -77,6 +121,19 @@ def load_config():
 
 CONFIG = load_config()
 
+# -- Metadata Cache --
+META_CACHE_DIR = os.path.join(".cache", "ytmeta")
+META_TTL = 24 * 60 * 60
+USE_CACHE = True
+
+
+@functools.lru_cache(maxsize=1)
+def _get_meta():
+    # Opening the cache creates the directory and loads sqlite, so defer it
+    from diskcache import Cache
+
+    return Cache(META_CACHE_DIR)
+
 
 # -- Proxy Check --
 def get_proxy(custom_proxy=None) -> str | None:
@@ -88,7 +145,7 @@ def get_proxy(custom_proxy=None) -> str | None:
     try:
         # Use a more reliable check or just trust the config if it's set?
         # Let's keep the check but make it faster.
-        resp = requests.get(
+        resp = get_session().get(
             "http://www.google.com/generate_204",
             proxies={"http": target, "https": target},
             timeout=5.0,
@@ -103,27 +160,78 @@ def get_proxy(custom_proxy=None) -> str | None:
     return None
 
 
-KEEP_PARAMS = {"v", "list"}
+def _preferred_sub_langs() -> list[str]:
+    # English plus the user's locale language, any regional variant
+    # (subtitleslangs takes regexes, so "de.*" covers de, de-DE, de-AT ...)
+    langs = ["en.*"]
+    loc = locale.getlocale()[0]
+    # Windows may report names like "English_United States"; skip those
+    if loc and loc.split("_")[0].islower():
+        langs.append(f"{re.escape(loc.split('_')[0])}.*")
+    return list(dict.fromkeys(langs))
+
+
+PREFERRED_LANGS = _preferred_sub_langs()
 CONTAINER_PREF = ["webm", "mp4", "mkv"]
+_CONTAINER_RANK = {c: i for i, c in enumerate(CONTAINER_PREF)}
+
+
+def _container_rank(cont: str) -> int:
+    return _CONTAINER_RANK.get(cont, len(CONTAINER_PREF))
+
+
+class Fmt(NamedTuple):
+    """Slim view of a yt-dlp format dict for the menu loop."""
+
+    height: int
+    fps: int
+    ext: str
+    tbr: float
+    ref: dict
 
 
 # -- URL Cleaning --
-def clean_youtube_url(raw: str) -> str:
-    raw = raw.strip()
-    parsed = urlparse(raw)
-    if parsed.netloc in ("youtu.be", "www.youtu.be"):
-        video_id = parsed.path.lstrip("/")
-        parsed = parsed._replace(
-            scheme="https",
-            netloc="www.youtube.com",
-            path="/watch",
-            query=f"v={video_id}",
-        )
+_CANON = re.compile(r"^https://www\.youtube\.com/watch\?v=[\w-]{11}$")
+_CANON_LIST = re.compile(r"^https://www\.youtube\.com/playlist\?list=[\w-]+$")
+_VID_RE = re.compile(r"[?&]v=([\w-]{11})(?=[&#]|$)")
+_SHORT_RE = re.compile(r"youtu\.be/([\w-]{11})(?=[?#/]|$)")
+_LIST_RE = re.compile(r"[?&]list=([\w-]+)(?=[&#]|$)")
+_YT_HOSTS = {"youtube.com", "www.youtube.com", "m.youtube.com", "music.youtube.com"}
+_SHORT_HOSTS = {"youtu.be", "www.youtu.be"}
+KEEP_PARAMS = {"v", "list"}
+
 
+def _filter_query(raw: str) -> str:
+    parsed = urlparse(raw)
     params = parse_qs(parsed.query, keep_blank_values=True)
     clean = {k: v for k, v in params.items() if k in KEEP_PARAMS}
-    cleaned_url = urlunparse(parsed._replace(query=urlencode(clean, doseq=True)))
-    return cleaned_url
+    return urlunparse(parsed._replace(query=urlencode(clean, doseq=True)))
+
+
+def clean_youtube_url(raw: str) -> str:
+    raw = raw.strip()
+    # Already canonical, nothing to strip
+    if _CANON.match(raw) or _CANON_LIST.match(raw):
+        return raw
+
+    host = urlparse(raw).netloc.lower()
+    if host in _SHORT_HOSTS:
+        vid = _SHORT_RE.search(raw)
+        host = "www.youtube.com"
+    elif host in _YT_HOSTS:
+        vid = _VID_RE.search(raw)
+    else:
+        # Not YouTube: keep the host, only drop tracking params
+        return _filter_query(raw)
+
+    # Only "v" and "list" matter; everything else is tracking noise
+    lst = _LIST_RE.search(raw)
+    if vid:
+        list_param = f"&list={lst.group(1)}" if lst else ""
+        return f"https://{host}/watch?v={vid.group(1)}{list_param}"
+    if lst:
+        return f"https://{host}/playlist?list={lst.group(1)}"
+    return _filter_query(raw)
 
 
 def _make_base_opts(proxy: str | None) -> dict:
@@ -149,17 +257,78 @@ def _make_base_opts(proxy: str | None) -> dict:
     return opts
 
 
+def _extract(url: str, proxy: str | None) -> dict | None:
+    # For playlist extraction, we use flat_playlist to quickly get titles
+    # and ignore errors if the first video is deleted.
+    fetch_opts = _make_base_opts(proxy)
+    fetch_opts.update({"extract_flat": "in_playlist"})
+
+    with _get_ytdlp().YoutubeDL(fetch_opts) as ydl:
+        info = ydl.extract_info(url, download=False)
+        # Raw info dicts hold unpicklable handles; sanitize before caching.
+        # Private keys (requested_formats, _filename ...) record the format
+        # picked at fetch time and would override the user's later choice.
+        if not info:
+            return None
+        return ydl.sanitize_info(info, remove_private_keys=True)
+
+
+def _cached_extract(url: str, proxy: str | None, announce: bool = True) -> dict | None:
+    if not USE_CACHE:
+        return _extract(url, proxy)
+    key = (url, proxy)
+    info = _get_meta().get(key)
+    if info is None:
+        info = _extract(url, proxy)
+        # Failed lookups are not cached so a retry hits the network again
+        if info:
+            _get_meta().set(key, info, expire=META_TTL)
+    elif announce:
+        print("[*] Using cached information.")
+    return info
+
+
+# -- Playlist Prefetch --
+PREFETCH_JOBS = 6
+
+
+def _extract_entry(entry: dict, proxy: str | None) -> dict | None:
+    try:
+        url = entry.get("webpage_url") or entry.get("url")
+        return _cached_extract(url, proxy, announce=False)
+    except Exception as e:
+        print(f"[!] Could not fetch {entry.get('id')}: {e}")
+        return None
+
+
+def _prefetch_entries(entries: list, proxy: str | None) -> dict | None:
+    """Resolve flat playlist entries in parallel into the metadata cache and
+    return the first one that resolved, for the quality menu.
+
+    Only that first entry is kept in memory; download workers read the rest
+    back from the cache. With the cache disabled there is nowhere to keep
+    them, so only the first entry is resolved."""
+    if not USE_CACHE:
+        return next(filter(None, (_extract_entry(e, proxy) for e in entries)), None)
+
+    print(f"[*] Fetching {len(entries)} playlist items …")
+    first = None
+    pool = ThreadPoolExecutor(max_workers=PREFETCH_JOBS)
+    try:
+        for info in pool.map(lambda e: _extract_entry(e, proxy), entries):
+            first = first or info
+    except KeyboardInterrupt:
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    pool.shutdown()
+    return first
+
+
 # -- Quality Menu --
 def select_quality(url: str, proxy: str | None):
     print("\n[*] Fetching information …")
     try:
-        # For playlist extraction, we use flat_playlist to quickly get titles
-        # and ignore errors if the first video is deleted.
-        fetch_opts = _make_base_opts(proxy)
-        fetch_opts.update({"extract_flat": "in_playlist"})
-
-        with yt_dlp.YoutubeDL(fetch_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
+        info = _cached_extract(url, proxy)
     except Exception as e:
         print(f"[!] Error fetching info: {e}")
         return None
@@ -176,33 +345,44 @@ def select_quality(url: str, proxy: str | None):
         # Filter out 'None' entries which represent unavailable videos
         valid_entries = [e for e in info["entries"] if e is not None]
         print(f"  Type     : PLAYLIST ({len(valid_entries)} accessible items)")
-        formats = valid_entries[0].get("formats", []) if valid_entries else []
+        # Flat entries carry no formats; resolve them all up front so the menu
+        # has real formats and the download doesn't re-extract each one.
+        first = _prefetch_entries(valid_entries, proxy) or {}
+        formats = first.get("formats", [])
     else:
         formats = info.get("formats", [])
 
     # 1. Build Quality List
+    # Audio-only and height-less formats never reach the loop body
+    video_fmts = (f for f in formats if f.get("height") and f.get("vcodec") != "none")
     seen = {}
-    for f in formats:
-        height = f.get("height")
-        if not height:
-            continue
-        fps = int(f.get("fps") or 30)
-        ext = f.get("ext", "")
-        key = (height, fps, ext)
-        if key not in seen or (f.get("tbr") or 0) > (seen[key].get("tbr") or 0):
-            seen[key] = f
-
-    sorted_fmts = sorted(seen.items(), key=lambda kv: (-kv[0][0], -kv[0][1]))
+    for f in video_fmts:
+        fmt = Fmt(
+            f["height"],
+            int(f.get("fps") or 30),
+            f.get("ext") or "",
+            f.get("tbr") or 0.0,
+            f,
+        )
+        key = (fmt.height, fmt.fps, fmt.ext)
+        if key not in seen or fmt.tbr > seen[key].tbr:
+            seen[key] = fmt
+
+    # Every option stays selectable, low resolutions included
+    sorted_fmts = sorted(
+        seen.items(),
+        key=lambda kv: (-kv[0][0], -kv[0][1], _container_rank(kv[0][2])),
+    )
 
     print(f"\n  {'#':<4} {'Option':<20} {'Format':<10}")
     print("  " + "─" * 40)
     print(f"  0    Download Audio (MP3)   [best]")
 
     options = [("Audio Only (MP3)", {"audio_only": True})]
-    for idx, ((h, fps, ext), f) in enumerate(sorted_fmts, 1):
+    for idx, ((h, fps, ext), fmt) in enumerate(sorted_fmts, 1):
         label = f"{h}p{fps if fps > 30 else ''} Video"
         print(f"  {idx:<4} {label:<20} [{ext}]")
-        options.append((label, f))
+        options.append((label, fmt.ref))
 
     while True:
         choice = input("\n  Selection (or 'q' to quit): ").strip().lower()
@@ -214,68 +394,284 @@ def select_quality(url: str, proxy: str | None):
 
 
 # -- Download Engine --
-def run_download(selection_tuple, output_dir):
-    (label, chosen), info, proxy = selection_tuple
-    url = info.get("webpage_url") or info.get("original_url")
+def _playlist_jobs(default: int = 4) -> int:
+    try:
+        return max(1, int(os.environ.get("YT_JOBS", default)))
+    except ValueError:
+        print(f"[!] Ignoring invalid YT_JOBS, using {default} workers.")
+        return default
+
 
-    ydl_opts = _make_base_opts(proxy)
-    ydl_opts.update(
+PLAYLIST_JOBS = _playlist_jobs()
+
+
+def _make_session_opts(proxy: str | None) -> MappingProxyType:
+    """Download options shared by every run in this session. Built once in
+    main(); per-run/per-entry options are layered on top."""
+    return MappingProxyType(
         {
-            "outtmpl": (
-                f"{output_dir}/%(playlist_title)s/%(title)s.%(ext)s"
-                if "entries" in info
-                else f"{output_dir}/%(title)s.%(ext)s"
-            ),
-            "ffmpeg_location": FFMPEG_PATH,
+            **_make_base_opts(proxy),
+            "ffmpeg_location": _resolve_ffmpeg(),
             "noplaylist": False,
             "ignoreerrors": True,
+            "concurrent_fragment_downloads": 8,
         }
     )
 
+
+PROGRESS_INTERVAL = 0.25  # seconds between status line redraws
+
+
+class _Console:
+    """Single writer for a download run: replaces yt-dlp's per-fragment
+    progress line with one status line for all active downloads, and doubles
+    as the yt-dlp logger so its messages never land on the unterminated
+    status line. Shared by every playlist worker; the status line is redrawn
+    (and flushed) at most every PROGRESS_INTERVAL."""
+
+    def __init__(self):
+        self.active = {}  # part filename -> "id/format: pct"
+        self.last_t = 0.0
+        self.width = 0
+        self.lock = threading.Lock()
+
+    def _write_line(self, line: str, end: str = ""):
+        # Pad over the previous line since "\r" doesn't clear it
+        sys.stdout.write(f"\r{line.ljust(self.width)}{end}")
+        self.width = 0 if end else len(line)
+
+    def _draw_status(self):
+        if self.active:
+            self._write_line("[*] " + " | ".join(self.active.values()))
+
+    def _message(self, msg: str):
+        with self.lock:
+            self._write_line(msg, "\n")
+            self._draw_status()
+            sys.stdout.flush()
+
+    # -- yt-dlp logger interface --
+    def debug(self, msg: str):
+        # yt-dlp sends both screen output and verbose logs here
+        if not msg.startswith("[debug] "):
+            self._message(msg)
+
+    def info(self, msg: str):
+        self._message(msg)
+
+    def warning(self, msg: str):
+        self._message(f"WARNING: {msg}")
+
+    def error(self, msg: str):
+        self._message(msg)
+
+    # -- progress hook --
+    def hook(self, d):
+        # Keyed per part file: a merged download reports video and audio
+        # separately, each with its own "finished" event.
+        name = d.get("filename") or ""
+        info = d.get("info_dict", {})
+        with self.lock:
+            if d.get("status") != "downloading":
+                # yt-dlp reports completion/errors itself via the logger
+                self.active.pop(name, None)
+                return
+            label = f"{info.get('id')}/{info.get('format_id')}"
+            self.active[name] = f"{label}: {d.get('_percent_str', '').strip()}"
+            now = time.monotonic()
+            if now - self.last_t < PROGRESS_INTERVAL:
+                return
+            self.last_t = now
+            self._draw_status()
+            sys.stdout.flush()
+
+
+def _per_entry_opts(ydl_opts: dict, playlist_title: str) -> dict:
+    # Workers download single entries, so the playlist folder has to be
+    # resolved up front from the top-level info instead of per entry.
+    folder = _get_ytdlp().utils.sanitize_filename(playlist_title)
+    folder = folder.replace("%", "%%")
+    return {
+        **ydl_opts,
+        "outtmpl": ydl_opts["outtmpl"].replace("%(playlist_title)s", folder),
+        "noplaylist": True,
+    }
+
+
+def _download_one(entry_url: str, opts: dict, prefetched: bool = False):
+    yt_dlp = _get_ytdlp()
+    entry_info = None
+    if prefetched and USE_CACHE:
+        try:
+            entry_info = _cached_extract(entry_url, opts.get("proxy"), announce=False)
+        except Exception:
+            pass
+    if entry_info:
+        # Reuse the prefetched metadata. Its signed format URLs expire after
+        # a few hours, so errors must raise here (ignoreerrors would only log
+        # them) to fall through to a fresh extraction below.
+        try:
+            with yt_dlp.YoutubeDL({**opts, "ignoreerrors": False}) as ydl:
+                ydl.process_ie_result(entry_info, download=True)
+            return
+        except yt_dlp.utils.DownloadError:
+            print(f"\n[*] Prefetched info for {entry_url} is stale, re-fetching")
+            _get_meta().delete((entry_url, opts.get("proxy")))
+    # Fresh YoutubeDL per call so progress hooks/state don't collide
+    with yt_dlp.YoutubeDL(opts) as ydl:
+        ydl.download([entry_url])
+
+
+def _download_group(group: list, opts: dict):
+    for url in group:
+        try:
+            _download_one(url, opts, prefetched=True)
+        except Exception as e:
+            print(f"\n[!] Skipped {url}: {e}")
+
+
+def _download_playlist(info: dict, ydl_opts: dict):
+    # Entries that would write the same file (a video listed twice, or two
+    # videos sharing a title) must not race on one output/.part file: repeats
+    # are dropped and same-titled entries run one after another in one worker.
+    groups = {}
+    seen_ids = set()
+    for e in info["entries"]:
+        url = e and (e.get("webpage_url") or e.get("url"))
+        vid = url and (e.get("id") or url)
+        if not url or vid in seen_ids:
+            continue
+        seen_ids.add(vid)
+        groups.setdefault(e.get("title") or vid, []).append(url)
+    opts = _per_entry_opts(ydl_opts, info.get("title") or "Playlist")
+
+    print(f"[*] Downloading {len(seen_ids)} items with {PLAYLIST_JOBS} workers")
+    pool = ThreadPoolExecutor(max_workers=PLAYLIST_JOBS)
+    futures = [pool.submit(_download_group, g, opts) for g in groups.values()]
+    try:
+        for fut in as_completed(futures):
+            fut.result()
+    except KeyboardInterrupt:
+        # Drop queued entries instead of draining the whole playlist
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    pool.shutdown()
+
+
+def run_download(selection_tuple, output_dir, session_opts: MappingProxyType):
+    (label, chosen), info, _proxy = selection_tuple
+    url = info.get("webpage_url") or info.get("original_url")
+
+    outtmpl = (
+        f"{output_dir}/%(playlist_title)s/%(title)s.%(ext)s"
+        if "entries" in info
+        else f"{output_dir}/%(title)s.%(ext)s"
+    )
+
+    console = _Console()
+    run_opts = {
+        **session_opts,
+        "outtmpl": outtmpl,
+        "noprogress": True,
+        "logger": console,
+        "progress_hooks": [console.hook],
+    }
+
     if "audio_only" in chosen:
         print(f"[*] Mode: Audio Only (MP3)")
-        ydl_opts.update(
-            {
-                "format": "bestaudio/best",
-                "postprocessors": [
-                    {
-                        "key": "FFmpegExtractAudio",
-                        "preferredcodec": "mp3",
-                        "preferredquality": "192",
-                    }
-                ],
-            }
-        )
+        ydl_opts = {
+            **run_opts,
+            "format": "bestaudio/best",
+            "postprocessors": [
+                {
+                    "key": "FFmpegExtractAudio",
+                    "preferredcodec": "mp3",
+                    "preferredquality": "192",
+                }
+            ],
+        }
     else:
         print(f"[*] Mode: Video ({label})")
         height = chosen.get("height")
-        ydl_opts.update(
-            {
-                "format": f"bestvideo[height<={height}]+bestaudio/best",
-                "merge_output_format": "mkv",
-                "writesubtitles": True,
-                "allsubtitles": True,
-                "embedsubtitles": True,
-            }
-        )
+        ydl_opts = {
+            **run_opts,
+            "format": f"bestvideo[height<={height}]+bestaudio/best",
+            "merge_output_format": "mkv",
+            # Mux only, never re-encode the merged streams
+            "postprocessor_args": {"merger": ["-c", "copy"]},
+            "writesubtitles": True,
+            "subtitleslangs": PREFERRED_LANGS,
+            "embedsubtitles": True,
+        }
 
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            ydl.download([url])
+        if "entries" in info:
+            _download_playlist(info, ydl_opts)
+        else:
+            _download_one(url, ydl_opts)
     except Exception as e:
         print(f"\n[!] Download failed: {e}")
 
 
+# -- Prompt History --
+HISTORY_FILE = os.path.expanduser("~/.ytdl_history")
+
+try:
+    import readline
+except ImportError:  # Not shipped with CPython on Windows
+    readline = None
+
+
+def _setup_readline():
+    if readline is None:
+        return
+    try:
+        readline.read_history_file(HISTORY_FILE)
+    except (FileNotFoundError, OSError):
+        pass
+    readline.set_history_length(200)
+    # Only URLs and folders go into history, not menu picks or y/n answers
+    readline.set_auto_history(False)
+    atexit.register(readline.write_history_file, HISTORY_FILE)
+
+
+def _prompt(text: str, default: str = "", remember: bool = False) -> str:
+    """input() that pre-fills `default` and optionally records the answer."""
+    if readline is None:
+        return input(text).strip() or default
+    readline.set_startup_hook(lambda: readline.insert_text(default))
+    try:
+        answer = input(text).strip()
+    finally:
+        readline.set_startup_hook()
+    if remember and answer:
+        readline.add_history(answer)
+    return answer
+
+
 def main():
+    global USE_CACHE
+    args = sys.argv[1:]
+    if "flush" in args:
+        if os.path.isdir(META_CACHE_DIR):
+            _get_meta().clear()
+        print("[*] Metadata cache flushed.")
+        return
+    if "--no-cache" in args:
+        USE_CACHE = False
+
     print("=" * 50)
     print(" YouTube Video & Playlist Downloader (Skip Errors Mode)")
     print("=" * 50)
 
     proxy = get_proxy()
+    session_opts = _make_session_opts(proxy)
+    _setup_readline()
+    last_out = "."
 
     while True:
         try:
-            url_raw = input("\nEnter URL: ").strip()
+            url_raw = _prompt("\nEnter URL: ", remember=True)
             if not url_raw:
                 continue
 
@@ -284,8 +680,11 @@ def main():
             if not result:
                 continue
 
-            out = input("Output Folder [.]: ").strip() or "."
-            run_download(result, out)
+            out = (
+                _prompt(f"Output Folder [{last_out}]: ", last_out, remember=True) or "."
+            )
+            last_out = out
+            run_download(result, out, session_opts)
 
             if input("\nAnother? (y/n): ").lower() != "y":
                 break